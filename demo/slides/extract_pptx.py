@@ -4,6 +4,17 @@ import re
 import os
 import sys
 
+try:
+    from lxml import etree
+except ImportError:
+    # Same element API, just slower
+    import xml.etree.ElementTree as etree
+
+_SLIDE_NUM_RE = re.compile(r'slide(\d+)\.xml')
+
+# DrawingML text run tag
+_A_T = '{http://schemas.openxmlformats.org/drawingml/2006/main}t'
+
 def extract_pptx_content(filepath):
     """
     Extracts text from a PPTX file, grouped by slide.
@@ -20,24 +31,31 @@ def extract_pptx_content(filepath):
             # Sort by number (slide1.xml, slide2.xml, ..., slide10.xml)
             # otherwise slide10 comes before slide2
             def get_slide_number(filename):
-                match = re.search(r'slide(\d+)\.xml', filename)
+                match = _SLIDE_NUM_RE.search(filename)
                 return int(match.group(1)) if match else 0
             
-            slide_files.sort(key=get_slide_number)
+            # Parse each number once and sort on plain ints
+            numbered = sorted((get_slide_number(f), f) for f in slide_files)
+            slide_files = [f for _, f in numbered]
 
             print(f"File: {os.path.basename(filepath)}")
             print(f"Found {len(slide_files)} slides.")
 
             slides_content = []
+            previews = []
             
-            for slide_file in slide_files:
-                xml_content = z.read(slide_file).decode('utf-8')
-                # Extract text using basic regex for <a:t> tags
+            for slide_num, slide_file in numbered:
+                # Stream the slide XML and collect the raw <a:t> text runs
                 # This misses some formatting but gets the raw text
-                text_matches = re.findall(r'<a:t[^>]*>(.*?)</a:t>', xml_content)
+                with z.open(slide_file) as fh:
+                    text_matches = [elem.text or "" for _, elem in etree.iterparse(fh) if elem.tag == _A_T]
                 slide_text = " ".join(text_matches)
                 slides_content.append(slide_text)
-                print(f"  Slide {get_slide_number(slide_file)}: {slide_text[:100]}...") # Preview
+                previews.append(f"  Slide {slide_num}: {slide_text[:100]}...")
+            
+            # Preview, written in one go rather than a print per slide
+            if previews:
+                sys.stdout.write("\n".join(previews) + "\n")
 
             return slides_content
 
@@ -3,8 +3,54 @@ import zipfile
 import re
 import os
 import sys
+import string
 import shutil
+import html
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+
+_SLIDE_FILE_RE = re.compile(r'ppt/slides/slide\d+\.xml')
+_SLIDE_NUM_RE = re.compile(r'slide(\d+)')
+# Paragraph open, paragraph close (group 1) or a text run (group 2).
+# Bytes pattern: slide XML is scanned undecoded, only the runs are decoded.
+_PARA_RUN_RE = re.compile(rb'<a:p(?: [^>]*)?>|(</a:p>)|<a:t(?: [^>]*)?>([^<]*)</a:t>')
+_TARGET_RE = re.compile(r'Target="([^"]+)"')
+_ALNUM_SET = frozenset(string.ascii_letters + string.digits)
+
+# Below this many slides, process start-up costs more than it saves
+_PARALLEL_MIN_SLIDES = 32
+
+def _slide_text_lines(xml_bytes):
+    """Returns the filtered paragraph lines of one slide's XML."""
+    # We want to identify title vs body if possible, but raw paragraphs are fine for now.
+    # Using regex for resilience as XML parsing namespaces can be tricky if not strict.
+    
+    # Single pass: collect runs into the open paragraph, emit it on </a:p>
+    slide_text_lines = []
+    texts = None # runs of the open paragraph
+    
+    for m in _PARA_RUN_RE.finditer(xml_bytes):
+        close, run = m.groups()
+        if run is not None:
+            if texts is not None:
+                texts.append(run)
+        elif close:
+            if texts:
+                # Runs are raw XML, so decode entities (&amp; &quot; ...) to
+                # keep slides.md plain text; render_deck escapes on output
+                line = html.unescape(b"".join(texts).decode('utf-8')).strip()
+                # Filter garbage: 
+                # 1. Skip if contains replacement character 
+                # 2. Skip if mostly punctuation/symbols (naive check)
+                if line and '' not in line:
+                    # minimal check for "real" text: at least one alphanumeric char
+                    if not _ALNUM_SET.isdisjoint(line):
+                        slide_text_lines.append(line)
+            texts = None
+        elif texts is None:
+            texts = []
+    
+    return slide_text_lines
 
 def extract_pptx_to_staging(pptx_path, staging_dir):
     """
@@ -13,9 +59,14 @@ def extract_pptx_to_staging(pptx_path, staging_dir):
     - staging_dir/slides.md: markdown representation
     """
     
-    if os.path.exists(staging_dir):
-        shutil.rmtree(staging_dir)
-    os.makedirs(os.path.join(staging_dir, "images"))
+    # Reuse an existing staging dir instead of rmtree + makedirs; images the
+    # deck no longer contains are pruned once the media pass is done
+    images_dir = os.path.join(staging_dir, "images")
+    if os.path.isdir(images_dir):
+        existing_images = {e.name for e in os.scandir(images_dir) if not e.is_dir()}
+    else:
+        existing_images = set()
+    os.makedirs(images_dir, exist_ok=True)
     
     # namespaces
     NS = {
@@ -25,86 +76,83 @@ def extract_pptx_to_staging(pptx_path, staging_dir):
     }
 
     with zipfile.ZipFile(pptx_path, 'r') as z:
+        # Partition the central directory in one pass. ZipInfo objects go
+        # straight to z.open/z.read, skipping the name -> info lookup.
+        media, slides, rels = [], [], {}
+        for info in z.infolist():
+            name = info.filename
+            if name.startswith("ppt/media/"):
+                media.append(info)
+            elif _SLIDE_FILE_RE.match(name):
+                slides.append(info)
+            elif name.startswith("ppt/slides/_rels/"):
+                rels[name] = info
+        
         # 1. Extract all media first
         media_map = {} # archive_path -> new_filename
-        for f in z.namelist():
-            if f.startswith("ppt/media/"):
-                filename = os.path.basename(f)
-                target_path = os.path.join(staging_dir, "images", filename)
-                with open(target_path, "wb") as img_out:
-                    img_out.write(z.read(f))
-                media_map[f] = filename
-                
-        # 2. Identify Slides
-        slides = []
-        for f in z.namelist():
-            if re.match(r'ppt/slides/slide\d+\.xml', f):
-                slides.append(f)
+        for info in media:
+            filename = os.path.basename(info.filename)
+            target_path = os.path.join(images_dir, filename)
+            # Stream in 1 MiB chunks rather than buffering the whole member
+            with z.open(info) as img_in, open(target_path, "wb") as img_out:
+                shutil.copyfileobj(img_in, img_out, length=1 << 20)
+            media_map[info.filename] = filename
+        extracted_media = set(media_map.values())
+        for stale in existing_images - extracted_media:
+            os.remove(os.path.join(images_dir, stale))
         
-        # Sort slides by number (slide1, slide2, ..., slide10)
-        slides.sort(key=lambda x: int(re.search(r'slide(\d+)', x).group(1)))
+        # 2. Sort slides by number (slide1, slide2, ..., slide10)
+        # Parse each number once and sort on plain ints
+        numbered = sorted((int(_SLIDE_NUM_RE.search(info.filename).group(1)), info.filename, info) for info in slides)
+        slides = [info for _, _, info in numbered]
         
-        md_output = []
+        # Parse XML for Text
+        if len(slides) >= _PARALLEL_MIN_SLIDES:
+            # ZipFile isn't safe to share, so decompress here and parse in workers
+            payloads = [z.read(info) for info in slides]
+            with ProcessPoolExecutor() as ex:
+                text_by_slide = list(ex.map(_slide_text_lines, payloads, chunksize=4))
+        else:
+            # Lazily, so only one slide is held in memory while writing
+            text_by_slide = (_slide_text_lines(z.read(info)) for info in slides)
         
-        for i, slide_file in enumerate(slides):
-            slide_num = i + 1
-            xml_content = z.read(slide_file).decode('utf-8')
-            
-            # Parse XML for Text
-            # We want to identify title vs body if possible, but raw paragraphs are fine for now.
-            # Using regex for resilience as XML parsing namespaces can be tricky if not strict.
-            
-            # Find all paragraphs
-            paragraphs = re.findall(r'<a:p(?: [^>]*)?>(.*?)</a:p>', xml_content, re.DOTALL)
-            slide_text_lines = []
-            
-            for p in paragraphs:
-                texts = re.findall(r'<a:t(?: [^>]*)?>(.*?)</a:t>', p, re.DOTALL)
-                if texts:
-                    line = "".join(texts).strip()
-                    # Filter garbage: 
-                    # 1. Skip if contains replacement character 
-                    # 2. Skip if mostly punctuation/symbols (naive check)
-                    if line and '' not in line:
-                        # minimal check for "real" text: at least one alphanumeric char
-                        if re.search(r'[a-zA-Z0-9]', line):
-                             slide_text_lines.append(line)
-            
-            # Find images via Relationships
-            slide_images = []
-            rels_file = slide_file.replace("ppt/slides/", "ppt/slides/_rels/") + ".rels"
-            if rels_file in z.namelist():
-                rels_xml = z.read(rels_file).decode('utf-8')
-                # Find relationships to media/images
-                # Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/image" Target="../media/image1.png"
-                # OR Target="media/image1.jpeg" depending on pptx version
+        # Write Slides.md as we go rather than collecting it in memory
+        with open(os.path.join(staging_dir, "slides.md"), "w", buffering=1 << 20) as md_out:
+            for i, (slide_info, slide_text_lines) in enumerate(zip(slides, text_by_slide)):
+                slide_num = i + 1
+                
+                # Find images via Relationships
+                slide_images = []
+                rels_file = slide_info.filename.replace("ppt/slides/", "ppt/slides/_rels/") + ".rels"
+                rels_info = rels.get(rels_file)
+                if rels_info is not None:
+                    rels_xml = z.read(rels_info).decode('utf-8')
+                    # Find relationships to media/images
+                    # Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/image" Target="../media/image1.png"
+                    # OR Target="media/image1.jpeg" depending on pptx version
                 
-                # Simple Regex for targets that look like images
-                targets = re.findall(r'Target="([^"]+)"', rels_xml)
-                for t in targets:
-                    if "media/" in t:
-                        media_filename = os.path.basename(t)
-                        # Check if we extracted it
-                        if os.path.exists(os.path.join(staging_dir, "images", media_filename)):
-                            slide_images.append(f"images/{media_filename}")
+                    # Simple Regex for targets that look like images
+                    targets = _TARGET_RE.findall(rels_xml)
+                    for t in targets:
+                        if "media/" in t:
+                            media_filename = os.path.basename(t)
+                            # Check if we extracted it
+                            if media_filename in extracted_media:
+                                slide_images.append(f"images/{media_filename}")
 
-            # Construct MD Entry
-            md_output.append(f"# Slide {slide_num}")
-            
-            if slide_images:
-                md_output.append("## Images")
-                for img in slide_images:
-                    md_output.append(f"- ![]({img})")
-            
-            md_output.append("## Content")
-            for line in slide_text_lines:
-                md_output.append(f"- {line}")
-            
-            md_output.append("\n---\n")
-            
-        # Write Slides.md
-        with open(os.path.join(staging_dir, "slides.md"), "w") as f:
-            f.write("\n".join(md_output))
+                # Construct MD Entry
+                md_out.write(f"# Slide {slide_num}\n")
+                
+                if slide_images:
+                    md_out.write("## Images\n")
+                    for img in slide_images:
+                        md_out.write(f"- ![]({img})\n")
+                
+                md_out.write("## Content\n")
+                for line in slide_text_lines:
+                    md_out.write(f"- {line}\n")
+                
+                md_out.write("\n---\n\n")
             
     print(f"Extraction complete to {staging_dir}")
 
@@ -2,6 +2,39 @@
 import zipfile
 import re
 import os
+import io
+import string
+import functools
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from lxml import etree
+    _LXML = True
+except ImportError:
+    # Same element API, just slower
+    import xml.etree.ElementTree as etree
+    _LXML = False
+
+_SLIDE_NUM_RE = re.compile(r'slide(\d+)\.xml')
+
+# DrawingML paragraph / text run tags
+_A_NS = '{http://schemas.openxmlformats.org/drawingml/2006/main}'
+_A_P = _A_NS + 'p'
+_A_T = _A_NS + 't'
+
+# Escapes slide text for HTML in a single C-level pass
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+# Below this many slides, process start-up costs more than it saves
+_PARALLEL_MIN_SLIDES = 32
+
+# Worker cap for the per-deck slide pool; None means one per CPU. Deck
+# workers lower it so the nested pools don't oversubscribe the machine.
+_slide_workers = None
+
+def _set_slide_workers(n):
+    global _slide_workers
+    _slide_workers = n
 
 # Configuration for decks
 DECKS = [
@@ -90,65 +123,101 @@ HTML_TEMPLATE = """<!doctype html>
 </html>
 """
 
+# HTML_TEMPLATE split once into (literal, placeholder) pairs, so rendering
+# streams chunks instead of a str.format parse per deck. {{ }} are unescaped here.
+_TEMPLATE_PARTS = [(literal, field) for literal, field, _, _ in string.Formatter().parse(HTML_TEMPLATE)]
+
+def _iter_template(**values):
+    for literal, field in _TEMPLATE_PARTS:
+        yield literal
+        if field is not None:
+            yield values[field]
+
+def _parse_slide(source):
+    """Returns the non-empty paragraph lines of one slide's XML file object."""
+    slide_lines = []
+    # Each <a:p> is complete on its end event
+    for _, elem in etree.iterparse(source):
+        if elem.tag != _A_P:
+            continue
+        # Join all text runs in the paragraph to form one line/bullet.
+        # Restricted to <a:t> text without tails: otherwise the whitespace
+        # between elements in pretty-printed XML leaks into the line.
+        if _LXML:
+            full_line = "".join(elem.itertext(_A_T, with_tail=False)).strip()
+        else:
+            full_line = "".join(t.text or "" for t in elem.iter(_A_T)).strip()
+        if full_line:
+            slide_lines.append(full_line)
+        elem.clear()
+    return slide_lines
+
+def _parse_slide_bytes(xml_bytes):
+    # Pool entry point: workers get bytes because ZipFile handles don't pickle
+    return _parse_slide(io.BytesIO(xml_bytes))
+
 def extract_slides(pptx_path):
     if not os.path.exists(pptx_path):
         print(f"Skipping {pptx_path}, not found.")
         return []
-        
-    slides_data = []
+    
+    # Errors are handled out here so lru_cache never stores a failed parse
     try:
-        with zipfile.ZipFile(pptx_path, 'r') as z:
-            slide_files = [f for f in z.namelist() if f.startswith('ppt/slides/slide') and f.endswith('.xml')]
-            
-            def get_slide_number(filename):
-                match = re.search(r'slide(\d+)\.xml', filename)
-                return int(match.group(1)) if match else 0
-            
-            slide_files.sort(key=get_slide_number)
-            
-            for slide_file in slide_files:
-                xml = z.read(slide_file).decode('utf-8')
-                
-                # Extract Paragraphs (robust regex)
-                # We use a non-greedy patch to find <a:p>...<a:p> or <a:p ...>...</a:p>
-                paragraphs = re.findall(r'<a:p(?: [^>]*)?>(.*?)</a:p>', xml, re.DOTALL)
-                slide_lines = []
-                
-                for p_content in paragraphs:
-                    # Find all text runs within this paragraph
-                    texts = re.findall(r'<a:t(?: [^>]*)?>(.*?)</a:t>', p_content, re.DOTALL)
-                    if texts:
-                        # Join all text parts in the paragraph to form one line/bullet
-                        full_line = "".join(texts).strip()
-                        if full_line:
-                            slide_lines.append(full_line)
-                            
-                if slide_lines:
-                    slides_data.append(slide_lines)
-                else:
-                    slides_data.append([])
-                    
+        cached = _extract_slides_cached(pptx_path, os.path.getmtime(pptx_path))
     except Exception as e:
         print(f"Error reading {pptx_path}: {e}")
+        return []
+    # Fresh lists per call; the cached tuples are shared between callers
+    return [list(lines) for lines in cached]
+
+@functools.lru_cache(maxsize=16)
+def _extract_slides_cached(pptx_path, mtime):
+    """Parses a deck once per (path, mtime); mtime is only in the key so edits re-parse."""
+    slides_data = []
+    with zipfile.ZipFile(pptx_path, 'r') as z:
+        slide_files = [f for f in z.namelist() if f.startswith('ppt/slides/slide') and f.endswith('.xml')]
         
-    return slides_data
+        def get_slide_number(filename):
+            match = _SLIDE_NUM_RE.search(filename)
+            return int(match.group(1)) if match else 0
+        
+        # Parse each number once and sort on plain ints
+        numbered = sorted((get_slide_number(f), f) for f in slide_files)
+        slide_files = [f for _, f in numbered]
+        
+        if len(slide_files) >= _PARALLEL_MIN_SLIDES:
+            # ZipFile isn't safe to share, so decompress here and parse in workers
+            payloads = [z.read(f) for f in slide_files]
+        else:
+            # Small deck: stream each slide out of the archive, no buffering
+            payloads = None
+            for f in slide_files:
+                with z.open(f) as fh:
+                    slides_data.append(_parse_slide(fh))
+        
+    if payloads is not None:
+        with ProcessPoolExecutor(max_workers=_slide_workers) as ex:
+            slides_data = list(ex.map(_parse_slide_bytes, payloads, chunksize=4))
+    
+    # Immutable, since every caller with the same key gets this object
+    return tuple(tuple(lines) for lines in slides_data)
 
 def generate_html(deck_config):
     print(f"Generating {deck_config['title']} from {deck_config['pptx']}...")
     raw_slides = extract_slides(deck_config['pptx'])
     
-    slides_html = ""
+    slides_html = io.StringIO()
     for i, slide_lines in enumerate(raw_slides):
         # Always create a slide, even if empty (matches PPTX count)
         
         # Heuristic: First line is title, rest are bullets
         if slide_lines:
-            title = slide_lines[0]
+            title = slide_lines[0].translate(_HTML_ESCAPE)
             body = slide_lines[1:]
             
             body_html = ""
             if body:
-                body_html = "<ul>" + "".join([f"<li>{line}</li>" for line in body]) + "</ul>"
+                body_html = "<ul>" + "".join([f"<li>{line.translate(_HTML_ESCAPE)}</li>" for line in body]) + "</ul>"
             
             slide_block = f"""
                 <section>
@@ -165,20 +234,28 @@ def generate_html(deck_config):
                 </section>
             """
             
-        slides_html += slide_block
-
-    final_html = HTML_TEMPLATE.format(
-        title=deck_config['title'],
-        theme_css=deck_config['theme_css'],
-        custom_css=deck_config['custom_css'],
-        slides_html=slides_html
-    )
-    
-    with open(deck_config['output'], 'w') as f:
-        f.write(final_html)
+        slides_html.write(slide_block)
+
+    # Stream the template chunks through a 1 MiB buffer; no full-page string
+    with open(deck_config['output'], 'w', buffering=1 << 20) as f:
+        f.writelines(_iter_template(
+            title=deck_config['title'],
+            theme_css=deck_config['theme_css'],
+            custom_css=deck_config['custom_css'],
+            slides_html=slides_html.getvalue()
+        ))
     
     print(f"Written {len(raw_slides)} slides to {deck_config['output']}")
 
 if __name__ == "__main__":
-    for deck in DECKS:
-        generate_html(deck)
+    # Decks share no state, so render them side by side. ProcessPoolExecutor
+    # rather than multiprocessing.Pool: Pool workers are daemonic and could
+    # not start extract_slides' own pool for large decks. That inner pool
+    # gets an equal share of the CPUs per deck.
+    cpus = os.cpu_count() or 1
+    with ProcessPoolExecutor(
+        max_workers=min(len(DECKS), cpus),
+        initializer=_set_slide_workers,
+        initargs=(max(1, cpus // len(DECKS)),),
+    ) as ex:
+        list(ex.map(generate_html, DECKS))